@@ -0,0 +1,23 @@
+""" Exports enhanced GPX data to GeoJSON, GPX, and TCX files """
+
+# Imports
+import os
+import mansfield_gpx as mfx
+
+# Define path to enhanced GPX attributes CSV
+gpx_attributes_enhance_csv = os.path.join(
+    "03-processed-data", "mansfield-double-up-course-data-enhanced.csv")
+
+# Export track to each format (streamed from CSV in chunks)
+for file_format in ["geojson", "gpx", "tcx"]:
+
+    track_out_path = os.path.join(
+        "03-processed-data", f"mansfield-double-up-course-track.{file_format}")
+
+    try:
+        mfx.export_track(
+            gpx_attributes_enhance_csv, track_out_path,
+            file_format=file_format)
+    except Exception as error:
+        print(f"Could not export track to {file_format.upper()}. "
+              f"ERROR: {error}")
@@ -2,9 +2,18 @@
 
 # Imports
 import os
+import argparse
+import numpy as np
 import pandas as pd
 import mansfield_gpx as mfx
 
+# Parse optional compact dtype mode
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument(
+    "--compact", action="store_true",
+    help="Store measurements as float32 and cadence as int16.")
+args = parser.parse_args()
+
 # Define relative path to GPX file
 double_up_gpx_path = os.path.join(
     "02-raw-data", "mansfield-double-up-course.gpx")
@@ -16,9 +25,18 @@ attribute_list = [
     "speed", "verticalSpeed"
 ]
 
-# Extract gpx data to dataframe
+# Define narrow column dtypes (compact mode only)
+attribute_dtypes = (
+    mfx.compact_dtypes(attribute_list, integer_cadence=True)
+    if args.compact else {})
+
+# Extract gpx data to dataframe (narrow arrays built per column)
 double_up_gpx_df = pd.DataFrame({
-    attribute: mfx.extract_gpx_data(double_up_gpx_path, attribute)
+    attribute: (
+        np.array(mfx.extract_gpx_data(double_up_gpx_path, attribute),
+                 dtype=attribute_dtypes[attribute])
+        if attribute in attribute_dtypes
+        else mfx.extract_gpx_data(double_up_gpx_path, attribute))
     for attribute in attribute_list
 })
 
@@ -1,4 +1,14 @@
+import os
 import re
+import json
+import shutil
+import hashlib
+import inspect
+import functools
+from xml.sax.saxutils import escape
+import numpy as np
+import pandas as pd
+from scipy.signal import savgol_filter
 import gpxpy
 
 
@@ -86,3 +96,1305 @@ def extract_gpx_data(gpx_file_path, attribute='elevation'):
 
     # List of attribute values
     return data
+
+
+def compact_dtypes(columns, integer_cadence=False):
+    """Returns narrow dtypes for GPX attribute columns, e.g.
+    for the dtype argument of pandas.read_csv or for building
+    column arrays directly.
+
+    Latitude/longitude stay float64 (float32 rounds positions
+    to about 1 meter).
+
+    Parameters
+    ----------
+    columns : list
+        Names of the GPX attribute columns.
+
+    integer_cadence : bool
+        Map cadence to int16. Default value is False, which
+        maps cadence to float32 (CSV cadence may be written
+        as '84.0'; compact_gpx_data casts it to int16).
+
+    Returns
+    -------
+    dtypes : dict
+        Column names mapped to numpy dtypes.
+    """
+    # Map measurement columns to float32 (cadence optionally int16)
+    return {
+        column: (np.int16 if integer_cadence and column == "cadence"
+                 else np.float32)
+        for column in columns
+        if column not in ("latitude", "longitude", "time")
+    }
+
+
+def compact_gpx_data(gpx_df):
+    """Downcasts GPX attribute data to narrow dtypes: float32
+    measurements and int16 cadence, keeping latitude/longitude
+    as float64.
+
+    Parameters
+    ----------
+    gpx_df : pandas dataframe
+        Dataframe containing GPX attributes.
+
+    Returns
+    -------
+    compact_df : pandas dataframe
+        Copy of the input dataframe with narrow dtypes.
+    """
+    # Downcast float64 measurement columns (skip columns already narrow)
+    compact_df = gpx_df.astype({
+        column: np.float32
+        for column in gpx_df.select_dtypes(include='float64').columns
+        if column not in ("latitude", "longitude")
+    })
+
+    # Store cadence (whole steps/minute) as small integer
+    if "cadence" in compact_df and compact_df.cadence.notna().all():
+        compact_df["cadence"] = compact_df.cadence.round().astype(np.int16)
+
+    # Compact dataframe
+    return compact_df
+
+
+def read_compact_gpx_csv(csv_path, chunksize=100000):
+    """Reads a GPX attributes CSV into a dataframe with narrow
+    dtypes. The CSV is read in chunks and time is converted to
+    datetime64 (UTC, without timezone) per chunk, so the time
+    strings of only one chunk are held in memory at once.
+
+    Parameters
+    ----------
+    csv_path : str
+        File path to the GPX attributes CSV (.csv extension).
+
+    chunksize : int
+        Number of rows read per chunk. Default value
+        is 100000.
+
+    Returns
+    -------
+    compact_df : pandas dataframe
+        Dataframe containing the GPX attributes with float32
+        measurements, int16 cadence, and datetime64 time.
+    """
+    # Define narrow column dtypes from CSV header
+    dtypes = compact_dtypes(pd.read_csv(csv_path, nrows=0).columns)
+
+    # Read chunks, converting time and cadence per chunk
+    chunks = []
+    for chunk in pd.read_csv(
+            filepath_or_buffer=csv_path, delimiter=',', header=0,
+            dtype=dtypes, chunksize=chunksize):
+        chunk["time"] = pd.to_datetime(chunk.time, utc=True).dt.tz_localize(None)
+        chunks.append(compact_gpx_data(chunk))
+
+    # Compact dataframe
+    return pd.concat(chunks, ignore_index=True)
+
+
+def haversine_distance(lat1, lon1, lat2, lon2):
+    """Computes the great-circle distance (meters) between
+    arrays of latitude/longitude pairs.
+
+    Parameters
+    ----------
+    lat1, lon1 : numpy array or float
+        Latitude/longitude (decimal degrees) of the
+        first set of points.
+
+    lat2, lon2 : numpy array or float
+        Latitude/longitude (decimal degrees) of the
+        second set of points.
+
+    Returns
+    -------
+    distance : numpy array or float
+        Distance in meters between the point pairs.
+    """
+    # Convert decimal degrees to radians
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+
+    # Compute haversine formula (mean Earth radius in meters)
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    distance = 2 * 6371008.8 * np.arcsin(np.sqrt(a))
+
+    # Distance in meters
+    return distance
+
+
+def filter_gpx_data(gpx_df, max_speed=10.0, max_vertical_speed=3.0,
+                    spike_window=11, window_length=7, polyorder=2,
+                    verbose=True, inplace=False):
+    """Removes spikes from and smooths GPX attribute data.
+
+    Points farther from the rolling median position (or
+    elevation) than the track could travel at the maximum
+    horizontal (or vertical) speed within the window, and
+    points whose reported speed or vertical speed exceed the
+    thresholds, are treated as outliers, set to missing, and
+    linearly interpolated. The rolling median is unaffected
+    by runs of up to (spike_window - 1) / 2 consecutive
+    outliers, so multi-point spikes are caught as well as
+    single points. Position, elevation, speed, and vertical
+    speed are then smoothed with a Savitzky-Golay filter.
+    All operations are vectorized.
+
+    Parameters
+    ----------
+    gpx_df : pandas dataframe
+        Dataframe containing the extracted GPX attributes
+        (latitude, longitude, elevation, time, speed,
+        verticalSpeed), with time as datetime values.
+
+    max_speed : float
+        Maximum plausible horizontal speed (meters/second).
+        Default value is 10.0.
+
+    max_vertical_speed : float
+        Maximum plausible vertical speed (meters/second).
+        Default value is 3.0.
+
+    spike_window : int
+        Rolling median window (number of points, odd) for
+        spike detection. Default value is 11.
+
+    window_length : int
+        Savitzky-Golay window length (number of points, odd).
+        Default value is 7.
+
+    polyorder : int
+        Savitzky-Golay polynomial order. Default value is 2.
+
+    verbose : bool
+        Print the number of replaced outliers. Default
+        value is True.
+
+    inplace : bool
+        Modify the input dataframe instead of a copy.
+        Default value is False.
+
+    Returns
+    -------
+    filtered_df : pandas dataframe
+        Dataframe with outliers replaced and attributes
+        smoothed.
+    """
+    # Copy dataframe to leave input unchanged (unless in place)
+    filtered_df = gpx_df if inplace else gpx_df.copy()
+
+    # Compute seconds elapsed within half a window either side of
+    #  each point (windows are truncated at the track ends)
+    point_count = len(filtered_df)
+    half_window = spike_window // 2
+    time = pd.to_datetime(filtered_df.time)
+    seconds = (time - time.min()).dt.total_seconds().to_numpy()
+    point_index = np.arange(point_count)
+    half_span = np.maximum(
+        seconds - seconds[np.maximum(point_index - half_window, 0)],
+        seconds[np.minimum(point_index + half_window, point_count - 1)]
+        - seconds)
+
+    # Compute rolling median position and elevation
+    def rolling_median(column):
+        return filtered_df[column].astype(float).rolling(
+            spike_window, center=True, min_periods=1).median().to_numpy()
+
+    position_deviation = haversine_distance(
+        filtered_df.latitude.to_numpy(), filtered_df.longitude.to_numpy(),
+        rolling_median("latitude"), rolling_median("longitude"))
+    elevation_deviation = np.abs(
+        filtered_df.elevation.to_numpy(dtype=float)
+        - rolling_median("elevation"))
+
+    # Flag points beyond reach of the median at the maximum speeds
+    #  (comparisons with missing times are False)
+    with np.errstate(invalid='ignore'):
+        position_spike = position_deviation > max_speed * half_span
+        elevation_spike = (
+            elevation_deviation > max_vertical_speed * half_span)
+
+    # Flag reported speed and vertical speed spikes
+    speed_spike = filtered_df.speed.abs().to_numpy() > max_speed
+    vertical_spike = (
+        filtered_df.verticalSpeed.abs().to_numpy() > max_vertical_speed)
+
+    # Mask outliers and fill by linear interpolation
+    spike_columns = {
+        "latitude": position_spike,
+        "longitude": position_spike,
+        "elevation": position_spike | elevation_spike,
+        "speed": speed_spike,
+        "verticalSpeed": vertical_spike
+    }
+
+    for column, spike_mask in spike_columns.items():
+        filtered_df[column] = filtered_df[column].mask(
+            spike_mask).interpolate(
+                method='linear', limit_direction='both')
+
+    # Smooth position, elevation, and speeds (skip short tracks)
+    if len(filtered_df) >= window_length:
+        for column in spike_columns:
+            filtered_df[column] = savgol_filter(
+                filtered_df[column].to_numpy(),
+                window_length=window_length,
+                polyorder=polyorder,
+                mode='interp').astype(filtered_df[column].dtype)
+
+    if verbose:
+        print(f"Filtered GPX data. Replaced {position_spike.sum()} position, "
+              f"{elevation_spike.sum()} elevation, {speed_spike.sum()} "
+              f"speed, and {vertical_spike.sum()} vertical speed outliers.")
+
+    # Filtered dataframe
+    return filtered_df
+
+
+@functools.lru_cache(maxsize=16)
+def load_dem_tile(tile_path):
+    """Opens a DEM tile as a read-only memory-mapped array.
+    Recently used tiles are kept open in an LRU cache; tile
+    values are read from disk only where they are sampled.
+    A missing tile raises an error (not cached), so a tile
+    added later is found on the next call.
+
+    Parameters
+    ----------
+    tile_path : str
+        File path to the DEM tile (.npy extension).
+
+    Returns
+    -------
+    tile : numpy memmap
+        Memory-mapped tile elevations (meters).
+    """
+    # Memory-mapped tile
+    return np.load(tile_path, mmap_mode='r')
+
+
+def sample_dem_elevation(latitude, longitude, dem_dir, nodata=-32768):
+    """Samples DEM elevation at each point with bilinear
+    interpolation.
+
+    DEM tiles are 1 x 1 degree .npy arrays named by their
+    south-west corner (SRTM convention, e.g. N44W073.npy),
+    with the first row at the north edge and grid points on
+    the tile edges.
+
+    Parameters
+    ----------
+    latitude : numpy array
+        Latitude of each point (decimal degrees).
+
+    longitude : numpy array
+        Longitude of each point (decimal degrees).
+
+    dem_dir : str
+        Path to the directory containing the DEM tiles.
+
+    nodata : float
+        Tile value marking missing data. Default value
+        is -32768.
+
+    Returns
+    -------
+    elevation : numpy array
+        DEM elevation (meters) at each point, NaN where no
+        tile or data is available.
+    """
+    # Convert coordinates to arrays
+    latitude = np.asarray(latitude, dtype=float)
+    longitude = np.asarray(longitude, dtype=float)
+    elevation = np.full(latitude.shape, np.nan)
+
+    # Group points by tile (south-west corner)
+    tile_south = np.floor(latitude).astype(int)
+    tile_west = np.floor(longitude).astype(int)
+    tile_keys, tile_index = np.unique(
+        np.stack([tile_south, tile_west], axis=1), axis=0,
+        return_inverse=True)
+    tile_index = tile_index.ravel()
+
+    for key_index, (south, west) in enumerate(tile_keys):
+
+        # Open tile (skip points without a tile)
+        tile_name = (f"{'N' if south >= 0 else 'S'}{abs(south):02d}"
+                     f"{'E' if west >= 0 else 'W'}{abs(west):03d}.npy")
+        tile_path = os.path.join(dem_dir, tile_name)
+        if not os.path.exists(tile_path):
+            continue
+        tile = load_dem_tile(tile_path)
+
+        # Convert coordinates to fractional row/column
+        in_tile = tile_index == key_index
+        rows = (south + 1 - latitude[in_tile]) * (tile.shape[0] - 1)
+        cols = (longitude[in_tile] - west) * (tile.shape[1] - 1)
+        row0 = np.clip(np.floor(rows).astype(int), 0, tile.shape[0] - 2)
+        col0 = np.clip(np.floor(cols).astype(int), 0, tile.shape[1] - 2)
+        row_frac = rows - row0
+        col_frac = cols - col0
+
+        # Gather surrounding grid values (reads only sampled pages)
+        corners = np.stack([
+            tile[row0, col0], tile[row0, col0 + 1],
+            tile[row0 + 1, col0], tile[row0 + 1, col0 + 1]
+        ]).astype(float)
+        corners[corners == nodata] = np.nan
+
+        # Interpolate bilinearly
+        elevation[in_tile] = (
+            corners[0] * (1 - row_frac) * (1 - col_frac)
+            + corners[1] * (1 - row_frac) * col_frac
+            + corners[2] * row_frac * (1 - col_frac)
+            + corners[3] * row_frac * col_frac)
+
+    # DEM elevation
+    return elevation
+
+
+def correct_elevation(gpx_df, dem_dir, drift_window=301, drift_fill=None,
+                      inplace=False):
+    """Corrects barometric elevation drift against a DEM.
+
+    The offset between barometric and DEM elevation is
+    smoothed with a rolling median and subtracted, which
+    removes slow drift while keeping the barometer's fine
+    relative resolution.
+
+    Parameters
+    ----------
+    gpx_df : pandas dataframe
+        Dataframe containing latitude, longitude, and
+        elevation (meters).
+
+    dem_dir : str
+        Path to the directory containing the DEM tiles.
+
+    drift_window : int
+        Rolling median window (number of points) for the
+        drift estimate. Default value is 301.
+
+    drift_fill : float
+        Drift (meters) used when no point has DEM data, e.g.
+        the last known drift of a previous chunk. Default
+        value is None, which raises an error instead.
+
+    inplace : bool
+        Modify the input dataframe instead of a copy.
+        Default value is False.
+
+    Returns
+    -------
+    corrected_df : pandas dataframe
+        Dataframe with added elevation_corrected (meters)
+        column.
+    """
+    # Copy dataframe to leave input unchanged (unless in place)
+    corrected_df = gpx_df if inplace else gpx_df.copy()
+
+    # Sample DEM at each point
+    dem_elevation = sample_dem_elevation(
+        corrected_df.latitude.to_numpy(), corrected_df.longitude.to_numpy(),
+        dem_dir)
+
+    # Check DEM covers the track
+    if np.isnan(dem_elevation).all() and drift_fill is None:
+        raise ValueError(
+            f"No DEM data in {dem_dir} covers the track. "
+            "Elevation cannot be corrected.")
+
+    # Estimate drift (fill points without DEM data)
+    drift = pd.Series(
+        corrected_df.elevation.to_numpy() - dem_elevation,
+        index=corrected_df.index).rolling(
+            drift_window, center=True, min_periods=1).median()
+    drift = drift.interpolate(limit_direction='both')
+    if drift_fill is not None:
+        drift = drift.fillna(drift_fill)
+
+    # Add corrected elevation
+    corrected_df["elevation_corrected"] = (
+        corrected_df.elevation - drift).astype(corrected_df.elevation.dtype)
+
+    # Corrected dataframe
+    return corrected_df
+
+
+def elevation_gain(elevation):
+    """Computes the total elevation gain of a track.
+
+    Parameters
+    ----------
+    elevation : pandas series or numpy array
+        Elevation of each point, in track order.
+
+    Returns
+    -------
+    gain : float
+        Sum of all positive elevation changes.
+    """
+    # Sum positive elevation changes
+    elevation_change = np.diff(np.asarray(elevation, dtype=float))
+
+    # Total elevation gain
+    return float(elevation_change[elevation_change > 0].sum())
+
+
+def project_coordinates(latitude, longitude, origin_latitude,
+                        origin_longitude):
+    """Projects latitude/longitude to local planar coordinates
+    (meters east/north of an origin) with an equirectangular
+    projection, accurate over the extent of a race course.
+
+    Parameters
+    ----------
+    latitude, longitude : numpy array
+        Latitude/longitude (decimal degrees) of each point.
+
+    origin_latitude, origin_longitude : float
+        Latitude/longitude (decimal degrees) of the origin.
+
+    Returns
+    -------
+    x, y : numpy array
+        Distance east and north of the origin (meters).
+    """
+    # Convert degrees to meters along each axis
+    meters_per_radian = 6371008.8
+    x = (np.radians(np.asarray(longitude, dtype=float) - origin_longitude)
+         * meters_per_radian * np.cos(np.radians(origin_latitude)))
+    y = (np.radians(np.asarray(latitude, dtype=float) - origin_latitude)
+         * meters_per_radian)
+
+    # Projected coordinates
+    return x, y
+
+
+def match_course(track_df, reference_df, band=100):
+    """Aligns a track to a reference route with dynamic time
+    warping constrained to a Sakoe-Chiba band.
+
+    The band is centered on the point of the reference route
+    that has covered the same fraction of its length as the
+    track, so stops and pace changes stay inside the band.
+    Each row of the cost matrix is computed with vectorized
+    operations (a running minimum resolves moves along the
+    reference), so time and memory are O(n * band).
+
+    Parameters
+    ----------
+    track_df : pandas dataframe
+        Dataframe containing the track latitude and longitude.
+
+    reference_df : pandas dataframe
+        Dataframe containing the reference route latitude
+        and longitude.
+
+    band : int
+        Number of reference points either side of the band
+        center that a track point may align to. Must exceed
+        the number of reference points in the largest missed
+        or shortcut section. Default value is 100.
+
+    Returns
+    -------
+    path_df : pandas dataframe
+        Alignment path in track order, with track_index,
+        reference_index, and deviation (meters between the
+        aligned points) columns.
+    """
+    # Check both tracks have enough points to align
+    if len(track_df) < 2 or len(reference_df) < 2:
+        raise ValueError(
+            "Track and reference route must each contain at least 2 "
+            f"points (got {len(track_df)} and {len(reference_df)}).")
+
+    # Project both tracks around the reference start
+    origin = reference_df.latitude.iloc[0], reference_df.longitude.iloc[0]
+    track_x, track_y = project_coordinates(
+        track_df.latitude.to_numpy(), track_df.longitude.to_numpy(), *origin)
+    reference_x, reference_y = project_coordinates(
+        reference_df.latitude.to_numpy(), reference_df.longitude.to_numpy(),
+        *origin)
+
+    # Compute fraction of length covered at each point
+    def length_fraction(x, y):
+        covered = np.concatenate([[0], np.cumsum(np.hypot(
+            np.diff(x), np.diff(y)))])
+        return covered / covered[-1] if covered[-1] > 0 else covered
+
+    track_count, reference_count = len(track_x), len(reference_x)
+    width = min(2 * band + 1, reference_count)
+
+    # Define band start (first reference index) for each track point
+    band_center = np.searchsorted(
+        length_fraction(reference_x, reference_y),
+        length_fraction(track_x, track_y))
+    band_start = np.clip(band_center - band, 0, reference_count - width)
+    band_start[0], band_start[-1] = 0, reference_count - width
+
+    # Fill accumulated cost row by row, storing moves for backtracking
+    #  (0: diagonal, 1: previous track point, 2: previous reference point)
+    moves = np.empty((track_count, width), dtype=np.int8)
+    previous_cost = None
+
+    for i in range(track_count):
+        start = band_start[i]
+        cost = np.hypot(track_x[i] - reference_x[start:start + width],
+                        track_y[i] - reference_y[start:start + width])
+
+        # Best diagonal/vertical predecessor
+        if previous_cost is None:
+            from_previous = np.full(width, np.inf)
+            from_previous[0] = 0
+            from_up = np.zeros(width, dtype=bool)
+        else:
+            offset = np.arange(start - 1, start + width) - band_start[i - 1]
+            in_band = (offset >= 0) & (offset < width)
+            shifted = np.where(
+                in_band, previous_cost[np.clip(offset, 0, width - 1)], np.inf)
+            diagonal, up = shifted[:-1], shifted[1:]
+            from_previous = np.minimum(diagonal, up)
+            from_up = up < diagonal
+
+        # Resolve horizontal moves with a running minimum
+        cumulative_cost = np.cumsum(cost)
+        candidate = from_previous + cost - cumulative_cost
+        running = np.minimum.accumulate(candidate)
+        previous_cost = running + cumulative_cost
+
+        moves[i] = np.where(candidate > running, 2, np.where(from_up, 1, 0))
+
+    # Check a path exists within the band
+    if not np.isfinite(previous_cost[-1]):
+        raise ValueError(
+            f"No alignment found within band of {band} points. "
+            "Increase the band.")
+
+    # Backtrack from the last point pair
+    path = []
+    i, j = track_count - 1, reference_count - 1
+    while True:
+        path.append((i, j))
+        if i == 0 and j == 0:
+            break
+        move = moves[i, j - band_start[i]]
+        if move == 0:
+            i, j = i - 1, j - 1
+        elif move == 1:
+            i -= 1
+        else:
+            j -= 1
+
+    track_index, reference_index = np.array(path[::-1]).T
+
+    print(f"Matched {track_count} track points to {reference_count} "
+          f"reference points (total cost {previous_cost[-1]:.0f} meters).")
+
+    # Alignment path
+    return pd.DataFrame({
+        "track_index": track_index,
+        "reference_index": reference_index,
+        "deviation": np.hypot(
+            track_x[track_index] - reference_x[reference_index],
+            track_y[track_index] - reference_y[reference_index])
+    })
+
+
+def missed_sections(path_df, max_deviation=50.0):
+    """Finds sections of the reference route the track did
+    not cover (missed or shortcut sections).
+
+    Parameters
+    ----------
+    path_df : pandas dataframe
+        Alignment path, as returned by match_course.
+
+    max_deviation : float
+        Distance (meters) beyond which a reference point is
+        considered missed. Default value is 50.0.
+
+    Returns
+    -------
+    sections_df : pandas dataframe
+        Dataframe with start_index and end_index (inclusive)
+        of each run of missed reference points.
+    """
+    # Find closest aligned track point for each reference point
+    reference_count = path_df.reference_index.max() + 1
+    closest = np.full(reference_count, np.inf)
+    np.minimum.at(
+        closest, path_df.reference_index.to_numpy(),
+        path_df.deviation.to_numpy())
+
+    # Find starts/ends of missed runs
+    missed = np.concatenate([[False], closest > max_deviation, [False]])
+    change = np.flatnonzero(np.diff(missed.astype(np.int8)))
+
+    # Missed sections
+    return pd.DataFrame({
+        "start_index": change[::2],
+        "end_index": change[1::2] - 1
+    })
+
+
+def checkpoint_splits(path_df, track_df, checkpoints):
+    """Computes the time a track reached each checkpoint on
+    the reference route.
+
+    Parameters
+    ----------
+    path_df : pandas dataframe
+        Alignment path, as returned by match_course.
+
+    track_df : pandas dataframe
+        Dataframe containing the track time values.
+
+    checkpoints : dict
+        Checkpoint names mapped to reference route indices.
+
+    Returns
+    -------
+    splits_df : pandas dataframe
+        Dataframe with checkpoint, reference_index, time, and
+        split (time since the previous checkpoint or start).
+    """
+    # Find first alignment reaching each checkpoint (path is ordered)
+    checkpoint_index = np.array(list(checkpoints.values()))
+    path_position = np.searchsorted(
+        path_df.reference_index.to_numpy(), checkpoint_index)
+    track_index = path_df.track_index.to_numpy()[
+        np.clip(path_position, 0, len(path_df) - 1)]
+
+    # Checkpoint times and splits
+    time = pd.to_datetime(track_df.time).reset_index(drop=True)
+    splits_df = pd.DataFrame({
+        "checkpoint": list(checkpoints.keys()),
+        "reference_index": checkpoint_index,
+        "time": time.iloc[track_index].to_numpy()
+    })
+    splits_df["split"] = splits_df.time.diff().fillna(
+        splits_df.time.iloc[0] - time.iloc[0])
+
+    # Checkpoint splits
+    return splits_df
+
+
+def enhance_gpx_data(gpx_df, energy_max=None, dem_dir=None,
+                     drift_window=301, drift_fill=None, verbose=True,
+                     inplace=False):
+    """Filters GPX attribute data and adds converted/derived
+    attributes for interpretation and plotting.
+
+    Parameters
+    ----------
+    gpx_df : pandas dataframe
+        Dataframe containing the extracted GPX attributes,
+        as written by extract_gpx_data.py.
+
+    energy_max : float
+        Maximum energy value used to normalize energy.
+        Default value is None, which uses the maximum
+        of the input dataframe.
+
+    dem_dir : str
+        Path to a directory of DEM tiles used to correct
+        elevation drift (see correct_elevation). Default
+        value is None, which skips the correction.
+
+    drift_window : int
+        Rolling median window (number of points) for the
+        elevation drift estimate. Default value is 301.
+
+    drift_fill : float
+        Elevation drift (meters) used when no point has DEM
+        data. Default value is None, which raises an error
+        instead.
+
+    verbose : bool
+        Print filtering summary. Default value is True.
+
+    inplace : bool
+        Modify the input dataframe instead of a copy.
+        Default value is False.
+
+    Returns
+    -------
+    enhanced_df : pandas dataframe
+        Dataframe containing the filtered and enhanced
+        GPX attributes.
+    """
+    # Copy dataframe once to leave input unchanged (unless in place);
+    #  later steps modify this frame in place
+    enhanced_df = gpx_df if inplace else gpx_df.copy()
+
+    # Convert dateime object to plottable format (remove timezone)
+    enhanced_df["time"] = pd.to_datetime(
+        enhanced_df.time, utc=True).dt.tz_localize(None)
+
+    # Change time to US Eastern, subtract 4 hours from timestamp
+    enhanced_df["time"] = enhanced_df.time - pd.Timedelta(hours=4)
+
+    # Remove GPS/vertical speed spikes and smooth track
+    filter_gpx_data(enhanced_df, verbose=verbose, inplace=True)
+
+    # Add elevation in feet
+    enhanced_df["elevation_ft"] = enhanced_df.elevation * 3.28084
+
+    # Add DEM-corrected elevation in meters and feet
+    if dem_dir is not None:
+        correct_elevation(
+            enhanced_df, dem_dir, drift_window=drift_window,
+            drift_fill=drift_fill, inplace=True)
+        enhanced_df["elevation_corrected_ft"] = (
+            enhanced_df.elevation_corrected * 3.28084)
+
+    # Add distance in miles
+    enhanced_df["distance_mile"] = enhanced_df.distance / 1609.344
+
+    # Drop altitude column (copy of elevation)
+    enhanced_df.drop(columns='altitude', inplace=True)
+
+    # Normalize energy (units unknown)
+    if energy_max is None:
+        energy_max = enhanced_df.energy.max()
+    enhanced_df["energy_norm"] = enhanced_df.energy / float(energy_max)
+
+    # Add speed in miles per hour
+    enhanced_df["speed_mph"] = enhanced_df.speed * 2.236936
+
+    # Add vertical speed in ft/second
+    enhanced_df["vertical_speed_ft_per_sec"] = (
+        enhanced_df.verticalSpeed * 3.28084)
+
+    # Enhanced dataframe
+    return enhanced_df
+
+
+def enhance_gpx_csv_chunked(csv_path, out_path, chunksize=100000,
+                            overlap=16, dem_dir=None, drift_window=301,
+                            compact=False):
+    """Enhances a GPX attributes CSV out-of-core, reading and
+    writing fixed-size chunks so that peak memory does not
+    depend on the size of the input file.
+
+    A first pass reads only the energy column (and position
+    and elevation when dem_dir is given) to find the
+    whole-track maximum used for normalization and to check
+    once that the DEM covers the track. A second pass
+    enhances each chunk together with the last rows of the
+    previous chunk, so that spike detection and smoothing
+    see the same neighbouring points as the in-memory mode.
+    Output matches the in-memory mode unless a run of
+    outliers longer than the overlap crosses a chunk
+    boundary; such a run is interpolated from the nearest
+    valid point inside the chunk instead. Likewise, where
+    no DEM data lies within the overlap, the last known
+    elevation drift is carried forward (the in-memory mode
+    interpolates it to the next DEM-covered point).
+
+    Parameters
+    ----------
+    csv_path : str
+        File path to the GPX attributes CSV (.csv extension).
+
+    out_path : str
+        File path to the enhanced output CSV (.csv extension).
+
+    chunksize : int
+        Number of rows read per chunk. Default value
+        is 100000.
+
+    overlap : int
+        Number of rows shared between neighbouring chunks.
+        Must be at least half the spike detection window plus
+        half the smoothing window (see filter_gpx_data), and
+        longer than any run of consecutive outliers for the
+        output to match the in-memory mode exactly. Default
+        value is 16.
+
+    dem_dir : str
+        Path to a directory of DEM tiles used to correct
+        elevation drift. Default value is None, which
+        skips the correction.
+
+    drift_window : int
+        Rolling median window (number of points) for the
+        elevation drift estimate. The overlap is extended to
+        at least this window when dem_dir is given. Default
+        value is 301.
+
+    compact : bool
+        Read and process chunks with narrow dtypes (see
+        compact_gpx_data). Default value is False.
+
+    Returns
+    -------
+    row_count : int
+        Number of rows written to the output CSV.
+    """
+    # Extend overlap to cover the elevation drift window
+    if dem_dir is not None:
+        overlap = max(overlap, drift_window)
+
+    # Check chunk size can hold the overlapping rows
+    if chunksize < overlap:
+        raise ValueError(
+            f"Chunk size ({chunksize}) must be at least the "
+            f"overlap ({overlap}).")
+
+    # Define column dtypes (narrow in compact mode)
+    dtypes = (compact_dtypes(pd.read_csv(csv_path, nrows=0).columns)
+              if compact else None)
+
+    # First pass: whole-track energy maximum (skip missing values)
+    #  and drift at the first point with DEM data
+    point_count = 0
+    chunk_energy_max = []
+    drift_fill = None
+    first_pass_columns = ['energy']
+    if dem_dir is not None:
+        first_pass_columns += ['latitude', 'longitude', 'elevation']
+
+    for chunk in pd.read_csv(
+            filepath_or_buffer=csv_path, delimiter=',', header=0,
+            usecols=first_pass_columns, dtype=dtypes, chunksize=chunksize):
+        point_count += len(chunk)
+        chunk_energy_max.append(chunk.energy.max())
+        if dem_dir is not None and drift_fill is None:
+            chunk_drift = chunk.elevation.to_numpy(
+                dtype=float) - sample_dem_elevation(
+                    chunk.latitude.to_numpy(), chunk.longitude.to_numpy(),
+                    dem_dir)
+            chunk_drift = chunk_drift[~np.isnan(chunk_drift)]
+            if len(chunk_drift):
+                drift_fill = float(chunk_drift[0])
+
+    # Check file contains track points
+    if point_count == 0:
+        raise ValueError(f"No track points in {csv_path}.")
+
+    energy_max = pd.Series(chunk_energy_max, dtype=float).max()
+
+    # Check DEM covers the track (once, not per chunk); until a chunk
+    #  has DEM data, the first drift is used (as in-memory back-fill)
+    if dem_dir is not None and drift_fill is None:
+        raise ValueError(
+            f"No DEM data in {dem_dir} covers the track. "
+            "Elevation cannot be corrected.")
+
+    # Second pass: enhance chunks and stream to CSV
+    carry = None
+    context_count = 0
+    row_count = 0
+    gain = 0.0
+
+    def write_rows(enhanced_block, first, last):
+        enhanced_block.iloc[first:last].to_csv(
+            path_or_buf=out_path, sep=',', header=row_count == 0,
+            index=False, mode='w' if row_count == 0 else 'a')
+        return len(enhanced_block.iloc[first:last])
+
+    def block_gain(enhanced_block, first, last):
+        # Include the change from the last previously written row
+        if dem_dir is None:
+            return 0.0
+        return elevation_gain(
+            enhanced_block.elevation_corrected.iloc[max(first - 1, 0):last])
+
+    for chunk in pd.read_csv(
+            filepath_or_buffer=csv_path, delimiter=',', header=0,
+            dtype=dtypes, chunksize=chunksize):
+
+        # Prepend rows carried over from the previous chunk
+        if compact:
+            chunk = compact_gpx_data(chunk)
+        block = pd.concat([carry, chunk], ignore_index=True)
+
+        # Write rows with complete neighbours on both sides
+        enhanced_block = enhance_gpx_data(
+            block, energy_max, dem_dir=dem_dir, drift_window=drift_window,
+            drift_fill=drift_fill, verbose=False)
+        end = max(len(block) - overlap, context_count)
+        gain += block_gain(enhanced_block, context_count, end)
+        row_count += write_rows(enhanced_block, context_count, end)
+
+        # Keep drift of the last written row for chunks without DEM data
+        if dem_dir is not None and end > 0:
+            drift_fill = float(
+                enhanced_block.elevation.iloc[end - 1]) - float(
+                    enhanced_block.elevation_corrected.iloc[end - 1])
+
+        # Carry context (written) and pending (unwritten) rows
+        start = max(end - overlap, 0)
+        carry = block.iloc[start:]
+        context_count = end - start
+
+    # Write pending rows from the final chunk
+    if carry is not None:
+        enhanced_block = enhance_gpx_data(
+            carry, energy_max, dem_dir=dem_dir, drift_window=drift_window,
+            drift_fill=drift_fill, verbose=False)
+        gain += block_gain(enhanced_block, context_count, len(carry))
+        row_count += write_rows(enhanced_block, context_count, len(carry))
+
+    print(f"Enhanced {row_count} rows in chunks of {chunksize}.")
+    if dem_dir is not None:
+        print(f"Total elevation gain (DEM corrected): {gain:.0f} meters")
+
+    # Number of rows written
+    return row_count
+
+
+def format_track_points(chunk, file_format, elevation_column, utc_offset):
+    """Formats a chunk of track points as GeoJSON coordinates,
+    GPX track points, or TCX trackpoints, filling one string
+    template per point from plain column values (no per-point
+    gpxpy or geometry objects).
+
+    Parameters
+    ----------
+    chunk : pandas dataframe
+        Dataframe containing enhanced GPX attributes.
+
+    file_format : str
+        Output format ('geojson', 'gpx', or 'tcx').
+
+    elevation_column : str
+        Name of the elevation (meters) column to export.
+
+    utc_offset : float
+        Hours the chunk time values are offset from UTC.
+
+    Returns
+    -------
+    points : list
+        Formatted string for each track point.
+    """
+    # Convert coordinates and elevation to plain floats
+    latitude = chunk.latitude.to_numpy(dtype=float).tolist()
+    longitude = chunk.longitude.to_numpy(dtype=float).tolist()
+    elevation = chunk[elevation_column].to_numpy(dtype=float).tolist()
+
+    # GeoJSON LineString coordinates
+    if file_format == "geojson":
+        return ["[%.7f,%.7f,%.2f]" % point
+                for point in zip(longitude, latitude, elevation)]
+
+    # Format time (UTC) and cadence (whole steps/minute)
+    time = np.char.add(np.datetime_as_string(
+        (pd.to_datetime(chunk.time) - pd.Timedelta(hours=utc_offset)
+         ).to_numpy(), unit='s'), "Z").tolist()
+    cadence = chunk.cadence.fillna(0).round().clip(0, 254).to_numpy(
+        dtype=int).tolist()
+
+    # GPX track points
+    if file_format == "gpx":
+        template = (
+            '      <trkpt lat="%.7f" lon="%.7f"><ele>%.2f</ele>'
+            "<time>%s</time><extensions><gpxtpx:TrackPointExtension>"
+            "<gpxtpx:cad>%d</gpxtpx:cad></gpxtpx:TrackPointExtension>"
+            "</extensions></trkpt>\n")
+        return [template % point for point in zip(
+            latitude, longitude, elevation, time, cadence)]
+
+    # TCX trackpoints
+    distance = chunk.distance.to_numpy(dtype=float).tolist()
+    speed = chunk.speed.to_numpy(dtype=float).tolist()
+    template = (
+        "          <Trackpoint><Time>%s</Time><Position>"
+        "<LatitudeDegrees>%.7f</LatitudeDegrees>"
+        "<LongitudeDegrees>%.7f</LongitudeDegrees></Position>"
+        "<AltitudeMeters>%.2f</AltitudeMeters>"
+        "<DistanceMeters>%.2f</DistanceMeters>"
+        "<Cadence>%d</Cadence>"
+        "<Extensions><ns3:TPX><ns3:Speed>%.3f</ns3:Speed></ns3:TPX>"
+        "</Extensions></Trackpoint>\n")
+    return [template % point for point in zip(
+        time, latitude, longitude, elevation, distance, cadence, speed)]
+
+
+def export_track(track, out_path, file_format="geojson",
+                 name="Mansfield Double Up", chunksize=100000,
+                 utc_offset=-4):
+    """Streams an enhanced GPX track to a GeoJSON LineString,
+    GPX, or TCX file, formatting fixed-size chunks directly
+    from the columns so that memory stays bounded.
+
+    Parameters
+    ----------
+    track : pandas dataframe or str
+        Dataframe containing enhanced GPX attributes, or file
+        path to the enhanced GPX attributes CSV (read in
+        chunks).
+
+    out_path : str
+        File path to the output file.
+
+    file_format : str
+        Output format. Must be one of 'geojson', 'gpx', or
+        'tcx'. Default value is 'geojson'.
+
+    name : str
+        Track name written to the output file. Default
+        value is 'Mansfield Double Up'.
+
+    chunksize : int
+        Number of track points formatted per chunk. Default
+        value is 100000.
+
+    utc_offset : float
+        Hours the track time values are offset from UTC.
+        Default value is -4 (US Eastern, as written by
+        process_gpx_data.py).
+
+    Returns
+    -------
+    point_count : int
+        Number of track points written.
+    """
+    # Check output format
+    if file_format not in ("geojson", "gpx", "tcx"):
+        raise ValueError(
+            f"Invalid format: {file_format}. Must be one of the "
+            "following: geojson, gpx, tcx.")
+
+    # Define track chunk reader (CSV path or dataframe)
+    def read_chunks(columns=None):
+        if isinstance(track, str):
+            return pd.read_csv(
+                filepath_or_buffer=track, delimiter=',', header=0,
+                usecols=columns, chunksize=chunksize)
+        track_df = track if columns is None else track[columns]
+        return (track_df.iloc[start:start + chunksize]
+                for start in range(0, len(track_df), chunksize))
+
+    # Export DEM-corrected elevation when available
+    if isinstance(track, str):
+        columns = pd.read_csv(track, nrows=0).columns
+    else:
+        columns = track.columns
+    elevation_column = (
+        "elevation_corrected" if "elevation_corrected" in columns
+        else "elevation")
+
+    # Define file header and footer
+    if file_format == "geojson":
+        header = ('{"type": "FeatureCollection", "features": [{"type": '
+                  f'"Feature", "properties": {{"name": {json.dumps(name)}}}, '
+                  '"geometry": {"type": "LineString", "coordinates": [')
+        footer = "]}}]}\n"
+
+    elif file_format == "gpx":
+        header = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<gpx version="1.1" creator="mansfield_gpx" '
+            'xmlns="http://www.topografix.com/GPX/1/1" '
+            'xmlns:gpxtpx="http://www.garmin.com/xmlschemas/'
+            'TrackPointExtension/v1">\n'
+            f"  <trk>\n    <name>{escape(name)}</name>\n    <trkseg>\n")
+        footer = "    </trkseg>\n  </trk>\n</gpx>\n"
+
+    else:
+        # First pass: lap start time, duration, and distance (skip
+        #  missing times, as the points without time are dropped)
+        chunk_start, chunk_end, total_distance = [], [], 0.0
+        for chunk in read_chunks(["time", "distance"]):
+            chunk_time = pd.to_datetime(chunk.time)
+            chunk_start.append(chunk_time.min())
+            chunk_end.append(chunk_time.max())
+            total_distance = max(total_distance, chunk.distance.max())
+
+        start_time = pd.Series(chunk_start, dtype='datetime64[ns]').min()
+        end_time = pd.Series(chunk_end, dtype='datetime64[ns]').max()
+
+        # Check track has time values
+        if pd.isna(start_time):
+            raise ValueError(
+                "No track points with time values. Cannot export TCX.")
+
+        lap_start = np.datetime_as_string(
+            (start_time - pd.Timedelta(hours=utc_offset)).to_datetime64(),
+            unit='s') + "Z"
+        header = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<TrainingCenterDatabase xmlns="http://www.garmin.com/'
+            'xmlschemas/TrainingCenterDatabase/v2" xmlns:ns3="http://'
+            'www.garmin.com/xmlschemas/ActivityExtension/v2">\n'
+            '  <Activities>\n    <Activity Sport="Running">\n'
+            f"      <Id>{lap_start}</Id>\n"
+            f'      <Lap StartTime="{lap_start}">\n'
+            "        <TotalTimeSeconds>"
+            f"{(end_time - start_time).total_seconds():.0f}"
+            "</TotalTimeSeconds>\n"
+            f"        <DistanceMeters>{total_distance:.2f}</DistanceMeters>\n"
+            "        <Calories>0</Calories>\n"
+            "        <Intensity>Active</Intensity>\n"
+            "        <TriggerMethod>Manual</TriggerMethod>\n"
+            "        <Track>\n")
+        footer = ("        </Track>\n      </Lap>\n"
+                  f"      <Notes>{escape(name)}</Notes>\n"
+                  "    </Activity>\n  </Activities>\n"
+                  "</TrainingCenterDatabase>\n")
+
+    # Define columns that must be finite in each point
+    required_columns = ["latitude", "longitude", elevation_column]
+    if file_format == "tcx":
+        required_columns += ["distance", "speed"]
+
+    # Stream formatted chunks to file
+    point_count = 0
+    dropped_count = 0
+    with open(out_path, "w") as out_file:
+        out_file.write(header)
+
+        for chunk in read_chunks():
+
+            # Drop points with missing/non-finite values or time
+            valid = np.isfinite(
+                chunk[required_columns].to_numpy(dtype=float)).all(axis=1)
+            if file_format != "geojson":
+                valid &= pd.to_datetime(chunk.time).notna().to_numpy()
+            dropped_count += int((~valid).sum())
+            chunk = chunk[valid]
+
+            if chunk.empty:
+                continue
+            points = format_track_points(
+                chunk, file_format, elevation_column, utc_offset)
+
+            # Separate GeoJSON coordinates (including across chunks)
+            if file_format == "geojson":
+                out_file.write(("," if point_count else "") + ",".join(points))
+            else:
+                out_file.write("".join(points))
+
+            point_count += len(points)
+
+        out_file.write(footer)
+
+    print(f"Exported {point_count} track points to {file_format.upper()}: "
+          f"{out_path}")
+    if dropped_count:
+        print(f"Dropped {dropped_count} track points with missing values.")
+
+    # Number of track points written
+    return point_count
+
+
+def figure_fingerprint(data_df, columns, style, plot_functions):
+    """Computes a fingerprint for a figure from its input
+    data, styling parameters, and plotting code.
+
+    Parameters
+    ----------
+    data_df : pandas dataframe
+        Dataframe containing the figure input data.
+
+    columns : list
+        Names of the columns the figure plots.
+
+    style : dict
+        Styling parameters used to render the figure
+        (e.g. style sheet, dpi, library versions).
+
+    plot_functions : list
+        Function that plots and saves the figure, followed by
+        any helper functions it draws through.
+
+    Returns
+    -------
+    fingerprint : str
+        Hexadecimal SHA-256 digest identifying the figure.
+    """
+    # Initialize hash
+    hasher = hashlib.sha256()
+
+    # Hash column names and values (vectorized row hashes)
+    hasher.update(repr(list(columns)).encode())
+    hasher.update(
+        pd.util.hash_pandas_object(
+            data_df[columns], index=True).to_numpy().tobytes())
+
+    # Hash styling parameters
+    hasher.update(repr(sorted(style.items())).encode())
+
+    # Hash plotting code (figure function and helpers)
+    for plot_function in plot_functions:
+        hasher.update(inspect.getsource(plot_function).encode())
+
+    # Figure fingerprint
+    return hasher.hexdigest()
+
+
+def render_cached_figure(plot_function, fig_path, fingerprint, cache_dir,
+                         max_cache_bytes=500 * 1024 ** 2):
+    """Reuses a cached figure PNG matching the fingerprint or,
+    on a cache miss, plots the figure and adds it to the cache.
+
+    The cache is bounded by disk size; least recently used
+    figures are evicted first.
+
+    Parameters
+    ----------
+    plot_function : function
+        Function that plots the figure and saves it to the
+        path it is called with.
+
+    fig_path : str
+        File path to the output figure (.png extension).
+
+    fingerprint : str
+        Figure fingerprint, as returned by figure_fingerprint.
+
+    cache_dir : str
+        Path to the figure cache directory.
+
+    max_cache_bytes : int
+        Maximum total size of the cache directory in bytes.
+        Default value is 500 MiB.
+
+    Returns
+    -------
+    cache_hit : bool
+        True if the figure was reused from the cache.
+    """
+    # Define path to cached figure
+    cache_path = os.path.join(cache_dir, f"{fingerprint}.png")
+
+    # Reuse cached figure and mark as recently used
+    if os.path.exists(cache_path):
+        shutil.copyfile(cache_path, fig_path)
+        os.utime(cache_path)
+        print(f"Reused cached plot as PNG: {fig_path}")
+        return True
+
+    # Plot and save figure (remove stale output first)
+    if os.path.exists(fig_path):
+        os.remove(fig_path)
+    plot_function(fig_path)
+
+    # Add figure to cache (skip if figure was not saved)
+    if os.path.exists(fig_path):
+        os.makedirs(cache_dir, exist_ok=True)
+        shutil.copyfile(fig_path, cache_path)
+
+        # Evict least recently used figures above size limit
+        cached_figures = sorted(
+            (entry for entry in os.scandir(cache_dir)
+             if entry.name.endswith(".png")),
+            key=lambda entry: entry.stat().st_mtime, reverse=True)
+
+        cache_bytes = 0
+        for entry in cached_figures:
+            cache_bytes += entry.stat().st_size
+            if cache_bytes > max_cache_bytes and entry.path != cache_path:
+                os.remove(entry.path)
+
+    # Figure was plotted
+    return False
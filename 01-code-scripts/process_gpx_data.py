@@ -2,58 +2,70 @@
 
 # Imports
 import os
-from datetime import datetime
+import argparse
 import pandas as pd
+import mansfield_gpx as mfx
+
+# Parse optional processing arguments
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument(
+    "--chunksize", type=int, default=None,
+    help="Process the CSV out-of-core in chunks of this many rows.")
+parser.add_argument(
+    "--dem-dir", default=None,
+    help="Correct elevation drift against .npy DEM tiles in this directory.")
+parser.add_argument(
+    "--compact", action="store_true",
+    help="Process measurements as float32 and cadence as int16.")
+args = parser.parse_args()
 
-""" Enhance data """
 # Define path to GPX attributes CSV
 gpx_attributes_csv = os.path.join(
     "03-processed-data", "mansfield-double-up-course-data.csv")
 
-# Load GPX attributes into dataframe
-double_up_df_enhance = pd.read_csv(
-    filepath_or_buffer=gpx_attributes_csv, delimiter=',', header=0)
-
-# Add elevation in feet
-double_up_df_enhance["elevation_ft"] = double_up_df_enhance.elevation.apply(
-    lambda x: x * 3.28084)
-
-# Convert dateime object to plottable format (remove timezone)
-double_up_df_enhance.time = double_up_df_enhance.time.apply(
-    lambda x: datetime.strptime(str(x).replace('+00:00', ''), '%Y-%m-%d %H:%M:%S'))
-
-# Change time to US Eastern, subtract 4 from timestamp hour
-double_up_df_enhance.time = double_up_df_enhance.time.apply(
-    lambda x: x.replace(hour=x.hour-4))
+# Define path to enhanced GPX attributes CSV
+df_enhance_out_path = os.path.join(
+    "03-processed-data", "mansfield-double-up-course-data-enhanced.csv")
 
-# Add distance in miles
-double_up_df_enhance["distance_mile"] = double_up_df_enhance.distance.apply(
-    lambda x: x / 1609.344)
+""" Enhance data """
+if args.chunksize:
 
-# Drop altitude column (copy of elevation)
-double_up_df_enhance.drop(columns='altitude', inplace=True)
+    # Enhance data in chunks and stream to CSV
+    try:
+        mfx.enhance_gpx_csv_chunked(
+            gpx_attributes_csv, df_enhance_out_path,
+            chunksize=args.chunksize, dem_dir=args.dem_dir,
+            compact=args.compact)
+    except Exception as error:
+        print(f"Could not write to CSV. ERROR: {error}")
+    else:
+        print(f"Wrote GPX attributes to CSV: {df_enhance_out_path}")
 
-# Normalize energy (units unknown)
-double_up_df_enhance["energy_norm"] = double_up_df_enhance.energy.apply(
-    lambda x: x / double_up_df_enhance.energy.max())
+else:
 
-# Add speed in miles per hour
-double_up_df_enhance["speed_mph"] = double_up_df_enhance.speed.apply(
-    lambda x: x * 2.236936)
+    # Load GPX attributes into dataframe (narrow dtypes in compact mode)
+    if args.compact:
+        double_up_df = mfx.read_compact_gpx_csv(gpx_attributes_csv)
+    else:
+        double_up_df = pd.read_csv(
+            filepath_or_buffer=gpx_attributes_csv, delimiter=',', header=0)
 
-# Add vertical speed in ft/second
-double_up_df_enhance["vertical_speed_ft_per_sec"] = double_up_df_enhance.verticalSpeed.apply(
-    lambda x: x * 3.28084)
+    # Filter and add converted/derived attributes
+    double_up_df_enhance = mfx.enhance_gpx_data(
+        double_up_df, dem_dir=args.dem_dir, inplace=True)
 
-""" Write enhanced data to CSV files"""
-# Write enhanced data to CSV
-df_enhance_out_path = os.path.join(
-    "03-processed-data", "mansfield-double-up-course-data-enhanced.csv")
+    # Report DEM-corrected total elevation gain
+    if args.dem_dir is not None:
+        print("Total elevation gain (DEM corrected): "
+              f"{mfx.elevation_gain(double_up_df_enhance.elevation_corrected):.0f}"
+              " meters")
 
-try:
-    double_up_df_enhance.to_csv(
-        path_or_buf=df_enhance_out_path, sep=',', header=True, index=False)
-except Exception as error:
-    print(f"Could not write to CSV. ERROR: {error}")
-else:
-    print(f"Wrote GPX attributes to CSV: {df_enhance_out_path}")
+    """ Write enhanced data to CSV files"""
+    # Write enhanced data to CSV
+    try:
+        double_up_df_enhance.to_csv(
+            path_or_buf=df_enhance_out_path, sep=',', header=True, index=False)
+    except Exception as error:
+        print(f"Could not write to CSV. ERROR: {error}")
+    else:
+        print(f"Wrote GPX attributes to CSV: {df_enhance_out_path}")
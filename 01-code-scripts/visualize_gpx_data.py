@@ -2,11 +2,20 @@
 
 # Imports
 import os
+import argparse
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.dates import DateFormatter
 import pandas as pd
-import geopandas as gpd
 from pandas.plotting import register_matplotlib_converters
+import mansfield_gpx as mfx
+
+# Parse optional compact dtype mode
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument(
+    "--compact", action="store_true",
+    help="Load measurements as float32 and cadence as int16.")
+args = parser.parse_args()
 
 # Datetime converters; matplotlib/pandas
 register_matplotlib_converters()
@@ -15,611 +24,702 @@ register_matplotlib_converters()
 gpx_attributes_enhance_csv = os.path.join(
     "03-processed-data", "mansfield-double-up-course-data-enhanced.csv")
 
-# Load enhanced GPX attributes into dataframe
-double_up_df_enhance = pd.read_csv(
-    filepath_or_buffer=gpx_attributes_enhance_csv, delimiter=',', header=0, parse_dates=['time'])
+# Load enhanced GPX attributes into dataframe (narrow dtypes in compact mode)
+if args.compact:
+    double_up_df_enhance = mfx.read_compact_gpx_csv(gpx_attributes_enhance_csv)
+else:
+    double_up_df_enhance = pd.read_csv(
+        filepath_or_buffer=gpx_attributes_enhance_csv, delimiter=',', header=0, parse_dates=['time'])
 
-# Create dataframes for UP (vertical speed >= 0)
-#  and DOWN (vertical speed < 0); for plotting purposes
-vertical_up_df = double_up_df_enhance[
-    double_up_df_enhance.vertical_speed_ft_per_sec >= 0]
+""" Plotting """
+# Define figure styling (part of the figure cache fingerprint)
+figure_style = {
+    "style": "dark_background",
+    "facecolor": "k",
+    "dpi": 300,
+    "matplotlib": matplotlib.__version__
+}
 
-vertical_down_df = double_up_df_enhance[
-    double_up_df_enhance.vertical_speed_ft_per_sec < 0]
 
-# Create geodataframe from dataframe; for plotting purposes
-crs = {'init': 'epsg:4326'}
-double_up_gdf = gpd.GeoDataFrame(
-    double_up_df_enhance,
-    geometry=gpd.points_from_xy(
-        double_up_df_enhance.longitude,
-        double_up_df_enhance.latitude)
-)
+# Plot course points from latitude/longitude arrays (no geometry objects)
+def plot_course_points(ax, course_df, markersize, **kwargs):
+    ax.scatter(course_df.longitude, course_df.latitude, s=markersize, **kwargs)
+    ax.set_aspect('equal')
 
-# Drop latitude/longitude (redundant with geometry)
-double_up_gdf.drop(columns=["latitude", "longitude"], inplace=True)
 
-""" Plotting """
-# Plot all raw data attributes over time
-with plt.style.context('dark_background'):
-
-    fig, ax = plt.subplots(6, 1, figsize=(20, 20))
-
-    plt.suptitle("Mansfield Double Up, 2017\nCourse Route Attributes", size=24)
-
-    plt.subplots_adjust(hspace=0.5)
-
-    ax[0].plot(
-        double_up_df_enhance.time, double_up_df_enhance.cadence,
-        label='Cadence', lw=1.5)
-
-    ax[1].plot(
-        double_up_df_enhance.time, double_up_df_enhance.distance_mile,
-        label='Distance', lw=1.5)
-    ax[1].fill_between(
-        double_up_df_enhance.time, double_up_df_enhance.distance_mile, alpha=0.5)
-
-    ax[2].plot(
-        double_up_df_enhance.time, double_up_df_enhance.energy_norm,
-        label='Normalized Energy', lw=1.5)
-
-    ax[3].plot(
-        double_up_df_enhance.time, double_up_df_enhance.speed_mph,
-        label='Speed', lw=1.5)
-
-    ax[4].plot(
-        double_up_df_enhance.time, double_up_df_enhance.vertical_speed_ft_per_sec,
-        label='Vertical Speed', lw=1.5, zorder=2)
-
-    ax[5].plot(double_up_df_enhance.time, double_up_df_enhance.elevation_ft,
-               label='Elevation', lw=1.5)
-
-    # Define the date format
-    date_form = DateFormatter("%H:%M AM")
-
-    ax[0].set_ylabel("Cadence\n(steps/minute)")
-    ax[1].set_ylabel("Total distance\n(miles)")
-    ax[2].set_ylabel("Normalized energy\n(fraction of max)")
-    ax[3].set_ylabel("Horizontal Speed\n(mph)")
-    ax[4].set_ylabel("Vertical Speed\n(feet/second)")
-    ax[5].set_ylabel("Elevation\n(feet)")
-
-    for axes in ax:
-        axes.xaxis.set_major_formatter(date_form)
-        axes.legend(loc='best',
-                    borderpad=0.75,
-                    edgecolor='white',
-                    fontsize=12,
-                    shadow=True)
-        axes.xaxis.label.set_size(14)
-        axes.yaxis.label.set_size(14)
-        axes.title.set_size(24)
-        axes.tick_params(labelsize=12)
-        axes.set_xlabel("Time (US Eastern)")
+# Create dataframes for UP (vertical speed >= 0)
+#  and DOWN (vertical speed < 0); for plotting purposes
+def split_vertical_movement(data_df):
+    vertical_up_df = data_df[data_df.vertical_speed_ft_per_sec >= 0]
+    vertical_down_df = data_df[data_df.vertical_speed_ft_per_sec < 0]
+    return vertical_up_df, vertical_down_df
 
-        # Add caption
-        fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
 
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-01.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-01.png')}")
+# Plot all raw data attributes over time
+def plot_figure_01(fig_path):
+    with plt.style.context(figure_style["style"]):
+
+        fig, ax = plt.subplots(6, 1, figsize=(20, 20))
+
+        plt.suptitle("Mansfield Double Up, 2017\nCourse Route Attributes", size=24)
+
+        plt.subplots_adjust(hspace=0.5)
+
+        ax[0].plot(
+            double_up_df_enhance.time, double_up_df_enhance.cadence,
+            label='Cadence', lw=1.5)
+
+        ax[1].plot(
+            double_up_df_enhance.time, double_up_df_enhance.distance_mile,
+            label='Distance', lw=1.5)
+        ax[1].fill_between(
+            double_up_df_enhance.time, double_up_df_enhance.distance_mile, alpha=0.5)
+
+        ax[2].plot(
+            double_up_df_enhance.time, double_up_df_enhance.energy_norm,
+            label='Normalized Energy', lw=1.5)
+
+        ax[3].plot(
+            double_up_df_enhance.time, double_up_df_enhance.speed_mph,
+            label='Speed', lw=1.5)
+
+        ax[4].plot(
+            double_up_df_enhance.time, double_up_df_enhance.vertical_speed_ft_per_sec,
+            label='Vertical Speed', lw=1.5, zorder=2)
+
+        ax[5].plot(double_up_df_enhance.time, double_up_df_enhance.elevation_ft,
+                   label='Elevation', lw=1.5)
+
+        # Define the date format
+        date_form = DateFormatter("%H:%M AM")
+
+        ax[0].set_ylabel("Cadence\n(steps/minute)")
+        ax[1].set_ylabel("Total distance\n(miles)")
+        ax[2].set_ylabel("Normalized energy\n(fraction of max)")
+        ax[3].set_ylabel("Horizontal Speed\n(mph)")
+        ax[4].set_ylabel("Vertical Speed\n(feet/second)")
+        ax[5].set_ylabel("Elevation\n(feet)")
+
+        for axes in ax:
+            axes.xaxis.set_major_formatter(date_form)
+            axes.legend(loc='best',
+                        borderpad=0.75,
+                        edgecolor='white',
+                        fontsize=12,
+                        shadow=True)
+            axes.xaxis.label.set_size(14)
+            axes.yaxis.label.set_size(14)
+            axes.title.set_size(24)
+            axes.tick_params(labelsize=12)
+            axes.set_xlabel("Time (US Eastern)")
+
+            # Add caption
+            fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 
 # Plot cadence, distinguishing up/down movement
-with plt.style.context('dark_background'):
+def plot_figure_02(fig_path):
+    vertical_up_df, vertical_down_df = split_vertical_movement(
+        double_up_df_enhance)
 
-    fig, ax = plt.subplots(figsize=(20, 10))
+    with plt.style.context(figure_style["style"]):
 
-    ax.scatter(
-        vertical_up_df.time, vertical_up_df.cadence, color='green',
-        label='Running Up', zorder=3, s=16)
+        fig, ax = plt.subplots(figsize=(20, 10))
 
-    ax.scatter(
-        vertical_down_df.time, vertical_down_df.cadence, color='purple',
-        label='Running Down', zorder=2, s=16)
+        ax.scatter(
+            vertical_up_df.time, vertical_up_df.cadence, color='green',
+            label='Running Up', zorder=3, s=16)
 
-    plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
+        ax.scatter(
+            vertical_down_df.time, vertical_down_df.cadence, color='purple',
+            label='Running Down', zorder=2, s=16)
 
-    ax.set_xlabel("Time (US Eastern)")
-    ax.set_ylabel("Cadence (steps/minute)")
-    ax.set_title("Mansfield Double Up Course, 2017\nCadence Throughout the Course", size=20)
-    ax.xaxis.label.set_size(20)
-    ax.yaxis.label.set_size(20)
-    ax.title.set_size(24)
-    ax.tick_params(labelsize=16)
+        plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
 
-    ax.legend(borderpad=0.75,
-              edgecolor='white',
-              fontsize=16,
-              shadow=True)
+        ax.set_xlabel("Time (US Eastern)")
+        ax.set_ylabel("Cadence (steps/minute)")
+        ax.set_title("Mansfield Double Up Course, 2017\nCadence Throughout the Course", size=20)
+        ax.xaxis.label.set_size(20)
+        ax.yaxis.label.set_size(20)
+        ax.title.set_size(24)
+        ax.tick_params(labelsize=16)
 
-    # Define the date format
-    date_form = DateFormatter("%H:%M AM")
-    ax.xaxis.set_major_formatter(date_form)
+        ax.legend(borderpad=0.75,
+                  edgecolor='white',
+                  fontsize=16,
+                  shadow=True)
 
-    # Add caption
-    fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+        # Define the date format
+        date_form = DateFormatter("%H:%M AM")
+        ax.xaxis.set_major_formatter(date_form)
 
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-02.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-02.png')}")
+        # Add caption
+        fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 # Plot accumulated distance, distinguishing up/down movement
-with plt.style.context('dark_background'):
+def plot_figure_03(fig_path):
+    vertical_up_df, vertical_down_df = split_vertical_movement(
+        double_up_df_enhance)
 
-    fig, ax = plt.subplots(figsize=(20, 10))
+    with plt.style.context(figure_style["style"]):
 
-    ax.scatter(
-        vertical_up_df.time, vertical_up_df.distance_mile, color='green',
-        label='Running Up', zorder=3, s=16)
+        fig, ax = plt.subplots(figsize=(20, 10))
 
-    ax.scatter(
-        vertical_down_df.time, vertical_down_df.distance_mile, color='purple',
-        label='Running Down', zorder=2, s=16)
+        ax.scatter(
+            vertical_up_df.time, vertical_up_df.distance_mile, color='green',
+            label='Running Up', zorder=3, s=16)
 
-    plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
+        ax.scatter(
+            vertical_down_df.time, vertical_down_df.distance_mile, color='purple',
+            label='Running Down', zorder=2, s=16)
 
-    ax.set_xlabel("Time (US Eastern)")
-    ax.set_ylabel("Total Distance (miles)")
-    ax.set_title("Mansfield Double Up Course, 2017\nDistance Throughout the Course", size=20)
-    ax.xaxis.label.set_size(20)
-    ax.yaxis.label.set_size(20)
-    ax.title.set_size(24)
-    ax.tick_params(labelsize=16)
+        plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
 
-    ax.legend(borderpad=0.75,
-              edgecolor='white',
-              fontsize=16,
-              shadow=True)
+        ax.set_xlabel("Time (US Eastern)")
+        ax.set_ylabel("Total Distance (miles)")
+        ax.set_title("Mansfield Double Up Course, 2017\nDistance Throughout the Course", size=20)
+        ax.xaxis.label.set_size(20)
+        ax.yaxis.label.set_size(20)
+        ax.title.set_size(24)
+        ax.tick_params(labelsize=16)
 
-    # Define the date format
-    date_form = DateFormatter("%H:%M AM")
-    ax.xaxis.set_major_formatter(date_form)
+        ax.legend(borderpad=0.75,
+                  edgecolor='white',
+                  fontsize=16,
+                  shadow=True)
 
-    # Add caption
-    fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+        # Define the date format
+        date_form = DateFormatter("%H:%M AM")
+        ax.xaxis.set_major_formatter(date_form)
 
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-03.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-03.png')}")
+        # Add caption
+        fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 # Plot normalized energry, distinguishing up/down movement
-with plt.style.context('dark_background'):
+def plot_figure_04(fig_path):
+    vertical_up_df, vertical_down_df = split_vertical_movement(
+        double_up_df_enhance)
 
-    fig, ax = plt.subplots(figsize=(20, 10))
+    with plt.style.context(figure_style["style"]):
 
-    ax.scatter(
-        vertical_up_df.time, vertical_up_df.energy_norm, color='green',
-        label='Running Up', zorder=3, s=16)  # , linewidth=2)
+        fig, ax = plt.subplots(figsize=(20, 10))
 
-    ax.scatter(
-        vertical_down_df.time, vertical_down_df.energy_norm, color='purple',
-        label='Running Down', zorder=2, s=16)
+        ax.scatter(
+            vertical_up_df.time, vertical_up_df.energy_norm, color='green',
+            label='Running Up', zorder=3, s=16)  # , linewidth=2)
 
-    plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
+        ax.scatter(
+            vertical_down_df.time, vertical_down_df.energy_norm, color='purple',
+            label='Running Down', zorder=2, s=16)
 
-    ax.set_xlabel("Time (US Eastern)")
-    ax.set_ylabel("Normalized energy (% of max)")
-    ax.set_title("Mansfield Double Up Course, 2017\nEnergy Throughout the Course", size=20)
-    ax.xaxis.label.set_size(20)
-    ax.yaxis.label.set_size(20)
-    ax.title.set_size(24)
-    ax.tick_params(labelsize=16)
+        plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
 
-    ax.legend(borderpad=0.75,
-              edgecolor='white',
-              fontsize=16,
-              shadow=True)
+        ax.set_xlabel("Time (US Eastern)")
+        ax.set_ylabel("Normalized energy (% of max)")
+        ax.set_title("Mansfield Double Up Course, 2017\nEnergy Throughout the Course", size=20)
+        ax.xaxis.label.set_size(20)
+        ax.yaxis.label.set_size(20)
+        ax.title.set_size(24)
+        ax.tick_params(labelsize=16)
 
-    # Define the date format
-    date_form = DateFormatter("%H:%M AM")
-    ax.xaxis.set_major_formatter(date_form)
+        ax.legend(borderpad=0.75,
+                  edgecolor='white',
+                  fontsize=16,
+                  shadow=True)
 
-    # Add caption
-    fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+        # Define the date format
+        date_form = DateFormatter("%H:%M AM")
+        ax.xaxis.set_major_formatter(date_form)
 
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-04.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-04.png')}")
+        # Add caption
+        fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 # Plot horizontal speed, distinguishing up/down movement
-with plt.style.context('dark_background'):
+def plot_figure_05(fig_path):
+    vertical_up_df, vertical_down_df = split_vertical_movement(
+        double_up_df_enhance)
 
-    fig, ax = plt.subplots(figsize=(20, 10))
+    with plt.style.context(figure_style["style"]):
 
-    ax.scatter(
-        vertical_up_df.time, vertical_up_df.speed_mph, color='green',
-        label='Running Up', zorder=3, s=16)  # , linewidth=2)
+        fig, ax = plt.subplots(figsize=(20, 10))
 
-    ax.scatter(
-        vertical_down_df.time, vertical_down_df.speed_mph, color='purple',
-        label='Running Down', zorder=2, s=16)
+        ax.scatter(
+            vertical_up_df.time, vertical_up_df.speed_mph, color='green',
+            label='Running Up', zorder=3, s=16)  # , linewidth=2)
 
-    plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
+        ax.scatter(
+            vertical_down_df.time, vertical_down_df.speed_mph, color='purple',
+            label='Running Down', zorder=2, s=16)
 
-    ax.set_xlabel("Time (US Eastern)")
-    ax.set_ylabel("Horizontal speed (mph)")
-    ax.set_title("Mansfield Double Up Course, 2017\nSpeed Throughout the Course", size=20)
-    ax.xaxis.label.set_size(20)
-    ax.yaxis.label.set_size(20)
-    ax.title.set_size(24)
-    ax.tick_params(labelsize=16)
+        plt.xlim(double_up_df_enhance.time.min(), double_up_df_enhance.time.max())
 
-    ax.legend(borderpad=0.75,
-              edgecolor='white',
-              fontsize=16,
-              shadow=True)
+        ax.set_xlabel("Time (US Eastern)")
+        ax.set_ylabel("Horizontal speed (mph)")
+        ax.set_title("Mansfield Double Up Course, 2017\nSpeed Throughout the Course", size=20)
+        ax.xaxis.label.set_size(20)
+        ax.yaxis.label.set_size(20)
+        ax.title.set_size(24)
+        ax.tick_params(labelsize=16)
 
-    # Define the date format
-    date_form = DateFormatter("%H:%M AM")
-    ax.xaxis.set_major_formatter(date_form)
+        ax.legend(borderpad=0.75,
+                  edgecolor='white',
+                  fontsize=16,
+                  shadow=True)
 
-    # Add caption
-    fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+        # Define the date format
+        date_form = DateFormatter("%H:%M AM")
+        ax.xaxis.set_major_formatter(date_form)
 
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-05.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-05.png')}")
+        # Add caption
+        fig.text(0.85, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 # Plot course lat/lon and distinguish up/down
-with plt.style.context('dark_background'):
-
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
-
-    # Subplot 1
-    double_up_gdf.plot(
-        ax=ax1, markersize=2, color='r', zorder=2, label='Course')
-
-    ax1.set_xlabel("Longitude")
-    ax1.set_ylabel("Latitude")
-    ax1.set_title("Mansfield Double Up Course, 2017", size=20)
-    ax1.grid(True, zorder=1)
-    ax1.xaxis.label.set_size(20)
-    ax1.yaxis.label.set_size(20)
-    ax1.title.set_size(24)
-    ax1.tick_params(labelsize=16)
-
-    ax1.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    # Add course direction arrows
-    ax1.annotate(
-        s='Start/\nFinish',
-        xy=(-72.79, double_up_df_enhance.latitude[0] + .0002),
-        xytext=(-72.79, double_up_df_enhance.latitude[0] + 0.0075),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'g',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.805, 44.5225), xytext=(-72.795, 44.5275),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.825, 44.5175), xytext=(-72.815, 44.5175),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.835, 44.5375), xytext=(-72.835, 44.5275),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.815, 44.54575), xytext=(-72.825, 44.54575),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.815, 44.5375), xytext=(-72.815, 44.5425),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.815, 44.5275), xytext=(-72.815, 44.5325),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.815, 44.5275), xytext=(-72.815, 44.5325),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.808, 44.5375), xytext=(-72.812, 44.5325),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    ax1.annotate(
-        s='', xy=(-72.795, 44.5375), xytext=(-72.805, 44.5425),
-        arrowprops={
-            'arrowstyle': '-|>',
-            'lw': 3,
-            'ec': 'purple',
-            'shrinkA': 2},
-        ha='center',
-        fontsize=16)
-
-    # Subplot 2
-    double_up_gdf[double_up_gdf.vertical_speed_ft_per_sec >= 0].plot(
-        ax=ax2, markersize=4, color='g', label="Running Up", zorder=3)
-    double_up_gdf[double_up_gdf.vertical_speed_ft_per_sec < 0].plot(
-        ax=ax2, markersize=4, color='purple', label="Running Down", zorder=2)
-
-    ax2.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    ax2.set_xlabel("Longitude")
-    ax2.set_ylabel("Latitude")
-    ax2.grid(True, zorder=1)
-    ax2.xaxis.label.set_size(20)
-    ax2.yaxis.label.set_size(20)
-    ax2.title.set_size(24)
-    ax2.tick_params(labelsize=16)
-
-    # Add caption
-    fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
-
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-06.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-06.png')}")
+def plot_figure_06(fig_path):
+    with plt.style.context(figure_style["style"]):
+
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
+
+        # Subplot 1
+        plot_course_points(
+            ax1, double_up_df_enhance,
+            markersize=2, color='r', zorder=2, label='Course')
+
+        ax1.set_xlabel("Longitude")
+        ax1.set_ylabel("Latitude")
+        ax1.set_title("Mansfield Double Up Course, 2017", size=20)
+        ax1.grid(True, zorder=1)
+        ax1.xaxis.label.set_size(20)
+        ax1.yaxis.label.set_size(20)
+        ax1.title.set_size(24)
+        ax1.tick_params(labelsize=16)
+
+        ax1.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        # Add course direction arrows
+        ax1.annotate(
+            s='Start/\nFinish',
+            xy=(-72.79, double_up_df_enhance.latitude[0] + .0002),
+            xytext=(-72.79, double_up_df_enhance.latitude[0] + 0.0075),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'g',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.805, 44.5225), xytext=(-72.795, 44.5275),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.825, 44.5175), xytext=(-72.815, 44.5175),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.835, 44.5375), xytext=(-72.835, 44.5275),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.815, 44.54575), xytext=(-72.825, 44.54575),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.815, 44.5375), xytext=(-72.815, 44.5425),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.815, 44.5275), xytext=(-72.815, 44.5325),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.815, 44.5275), xytext=(-72.815, 44.5325),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.808, 44.5375), xytext=(-72.812, 44.5325),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        ax1.annotate(
+            s='', xy=(-72.795, 44.5375), xytext=(-72.805, 44.5425),
+            arrowprops={
+                'arrowstyle': '-|>',
+                'lw': 3,
+                'ec': 'purple',
+                'shrinkA': 2},
+            ha='center',
+            fontsize=16)
+
+        # Subplot 2
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.vertical_speed_ft_per_sec >= 0],
+            markersize=4, color='g', label="Running Up", zorder=3)
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.vertical_speed_ft_per_sec < 0],
+            markersize=4, color='purple', label="Running Down", zorder=2)
+
+        ax2.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        ax2.set_xlabel("Longitude")
+        ax2.set_ylabel("Latitude")
+        ax2.grid(True, zorder=1)
+        ax2.xaxis.label.set_size(20)
+        ax2.yaxis.label.set_size(20)
+        ax2.title.set_size(24)
+        ax2.tick_params(labelsize=16)
+
+        # Add caption
+        fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 # Plot course lat/lon with cadence
-with plt.style.context('dark_background'):
-
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
-
-    # Subplot 1
-    double_up_gdf[double_up_gdf.cadence >= double_up_gdf.cadence.median()].plot(
-        ax=ax1, markersize=4, color='g', label="> Median Cadence", zorder=3)
-    double_up_gdf[double_up_df_enhance.cadence < double_up_df_enhance.cadence.median()].plot(
-        ax=ax1, markersize=4, color='purple', label="< Median Cadence", zorder=2)
-
-    ax1.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    ax1.set_xlabel("Longitude")
-    ax1.set_ylabel("Latitude")
-    ax1.set_title("Mansfield Double Up Course, 2017\nCadence", size=20)
-    ax1.grid(True, zorder=1)
-    ax1.xaxis.label.set_size(20)
-    ax1.yaxis.label.set_size(20)
-    ax1.title.set_size(24)
-    ax1.tick_params(labelsize=16)
-
-    # Subplot 2
-    double_up_gdf[double_up_gdf.cadence >= double_up_gdf.cadence.max()*0.75].plot(
-        ax=ax2, markersize=4, color='#1a9641', label="> 75% Max Cadence", zorder=5)
-    double_up_gdf[(double_up_gdf.cadence < double_up_gdf.cadence.max()*0.75) & (double_up_gdf.cadence >= double_up_gdf.cadence.max()*0.5)].plot(
-        ax=ax2, markersize=4, color='#a6d96a', label="50%-75% Max Cadence", zorder=4)
-    double_up_gdf[(double_up_gdf.cadence < double_up_gdf.cadence.max()*0.50) & (double_up_gdf.cadence >= double_up_gdf.cadence.max()*0.25)].plot(
-        ax=ax2, markersize=4, color='#fdae61', label="25%-50% Max Cadence", zorder=3)
-    double_up_gdf[double_up_gdf.cadence < double_up_gdf.cadence.max()*0.25].plot(
-        ax=ax2, markersize=4, color='#d7191c', label="< 25% Max Cadence", zorder=6)
-
-    ax2.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    ax2.set_xlabel("Longitude")
-    ax2.set_ylabel("Latitude")
-    ax2.grid(True, zorder=1)
-    ax2.xaxis.label.set_size(20)
-    ax2.yaxis.label.set_size(20)
-    ax2.title.set_size(24)
-    ax2.tick_params(labelsize=16)
-
-    # Add caption
-    fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
-
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-07.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-07.png')}")
+def plot_figure_07(fig_path):
+    with plt.style.context(figure_style["style"]):
+
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
+
+        # Subplot 1
+        plot_course_points(
+            ax1, double_up_df_enhance[double_up_df_enhance.cadence >= double_up_df_enhance.cadence.median()],
+            markersize=4, color='g', label="> Median Cadence", zorder=3)
+        plot_course_points(
+            ax1, double_up_df_enhance[double_up_df_enhance.cadence < double_up_df_enhance.cadence.median()],
+            markersize=4, color='purple', label="< Median Cadence", zorder=2)
+
+        ax1.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        ax1.set_xlabel("Longitude")
+        ax1.set_ylabel("Latitude")
+        ax1.set_title("Mansfield Double Up Course, 2017\nCadence", size=20)
+        ax1.grid(True, zorder=1)
+        ax1.xaxis.label.set_size(20)
+        ax1.yaxis.label.set_size(20)
+        ax1.title.set_size(24)
+        ax1.tick_params(labelsize=16)
+
+        # Subplot 2
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.cadence >= double_up_df_enhance.cadence.max()*0.75],
+            markersize=4, color='#1a9641', label="> 75% Max Cadence", zorder=5)
+        plot_course_points(
+            ax2, double_up_df_enhance[(double_up_df_enhance.cadence < double_up_df_enhance.cadence.max()*0.75) & (double_up_df_enhance.cadence >= double_up_df_enhance.cadence.max()*0.5)],
+            markersize=4, color='#a6d96a', label="50%-75% Max Cadence", zorder=4)
+        plot_course_points(
+            ax2, double_up_df_enhance[(double_up_df_enhance.cadence < double_up_df_enhance.cadence.max()*0.50) & (double_up_df_enhance.cadence >= double_up_df_enhance.cadence.max()*0.25)],
+            markersize=4, color='#fdae61', label="25%-50% Max Cadence", zorder=3)
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.cadence < double_up_df_enhance.cadence.max()*0.25],
+            markersize=4, color='#d7191c', label="< 25% Max Cadence", zorder=6)
+
+        ax2.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        ax2.set_xlabel("Longitude")
+        ax2.set_ylabel("Latitude")
+        ax2.grid(True, zorder=1)
+        ax2.xaxis.label.set_size(20)
+        ax2.yaxis.label.set_size(20)
+        ax2.title.set_size(24)
+        ax2.tick_params(labelsize=16)
+
+        # Add caption
+        fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 
 # Plot course lat/lon with speed
-with plt.style.context('dark_background'):
-
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
-
-    # Subplot 1
-    double_up_gdf[double_up_gdf.speed_mph >= double_up_gdf.speed_mph.median()].plot(
-        ax=ax1, markersize=4, color='g', label="> Median Speed", zorder=3)
-    double_up_gdf[double_up_gdf.speed_mph < double_up_gdf.speed_mph.median()].plot(
-        ax=ax1, markersize=4, color='purple', label="< Median Speed", zorder=2)
-
-    ax1.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    ax1.set_xlabel("Longitude")
-    ax1.set_ylabel("Latitude")
-    ax1.set_title("Mansfield Double Up Course, 2017\nSpeed", size=20)
-    ax1.grid(True, zorder=1)
-    ax1.xaxis.label.set_size(20)
-    ax1.yaxis.label.set_size(20)
-    ax1.title.set_size(24)
-    ax1.tick_params(labelsize=16)
-
-    # Subplot 2
-    double_up_gdf[double_up_gdf.speed_mph >= double_up_gdf.speed_mph.max()*0.75].plot(
-        ax=ax2, markersize=4, color='#1a9641', label="> 75% Max Speed", zorder=5)
-    double_up_gdf[(double_up_gdf.speed_mph < double_up_gdf.speed_mph.max()*0.75) & (double_up_gdf.speed_mph >= double_up_gdf.speed_mph.max()*0.5)].plot(
-        ax=ax2, markersize=4, color='#a6d96a', label="50%-75% Max Speed", zorder=4)
-    double_up_gdf[(double_up_gdf.speed_mph < double_up_gdf.speed_mph.max()*0.50) & (double_up_gdf.speed_mph >= double_up_gdf.speed_mph.max()*0.25)].plot(
-        ax=ax2, markersize=4, color='#fdae61', label="25%-50% Max Speed", zorder=4)
-    double_up_gdf[double_up_gdf.speed_mph < double_up_gdf.speed_mph.max()*0.25].plot(
-        ax=ax2, markersize=4, color='#d7191c', label="< 25% Max Speed", zorder=2)
-
-    ax2.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    ax2.set_xlabel("Longitude")
-    ax2.set_ylabel("Latitude")
-    ax2.grid(True, zorder=1)
-    ax2.xaxis.label.set_size(20)
-    ax2.yaxis.label.set_size(20)
-    ax2.title.set_size(24)
-    ax2.tick_params(labelsize=16)
-
-    # Add caption
-    fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
-
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-08.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-08.png')}")
+def plot_figure_08(fig_path):
+    with plt.style.context(figure_style["style"]):
+
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
+
+        # Subplot 1
+        plot_course_points(
+            ax1, double_up_df_enhance[double_up_df_enhance.speed_mph >= double_up_df_enhance.speed_mph.median()],
+            markersize=4, color='g', label="> Median Speed", zorder=3)
+        plot_course_points(
+            ax1, double_up_df_enhance[double_up_df_enhance.speed_mph < double_up_df_enhance.speed_mph.median()],
+            markersize=4, color='purple', label="< Median Speed", zorder=2)
+
+        ax1.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        ax1.set_xlabel("Longitude")
+        ax1.set_ylabel("Latitude")
+        ax1.set_title("Mansfield Double Up Course, 2017\nSpeed", size=20)
+        ax1.grid(True, zorder=1)
+        ax1.xaxis.label.set_size(20)
+        ax1.yaxis.label.set_size(20)
+        ax1.title.set_size(24)
+        ax1.tick_params(labelsize=16)
+
+        # Subplot 2
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.speed_mph >= double_up_df_enhance.speed_mph.max()*0.75],
+            markersize=4, color='#1a9641', label="> 75% Max Speed", zorder=5)
+        plot_course_points(
+            ax2, double_up_df_enhance[(double_up_df_enhance.speed_mph < double_up_df_enhance.speed_mph.max()*0.75) & (double_up_df_enhance.speed_mph >= double_up_df_enhance.speed_mph.max()*0.5)],
+            markersize=4, color='#a6d96a', label="50%-75% Max Speed", zorder=4)
+        plot_course_points(
+            ax2, double_up_df_enhance[(double_up_df_enhance.speed_mph < double_up_df_enhance.speed_mph.max()*0.50) & (double_up_df_enhance.speed_mph >= double_up_df_enhance.speed_mph.max()*0.25)],
+            markersize=4, color='#fdae61', label="25%-50% Max Speed", zorder=4)
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.speed_mph < double_up_df_enhance.speed_mph.max()*0.25],
+            markersize=4, color='#d7191c', label="< 25% Max Speed", zorder=2)
+
+        ax2.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        ax2.set_xlabel("Longitude")
+        ax2.set_ylabel("Latitude")
+        ax2.grid(True, zorder=1)
+        ax2.xaxis.label.set_size(20)
+        ax2.yaxis.label.set_size(20)
+        ax2.title.set_size(24)
+        ax2.tick_params(labelsize=16)
+
+        # Add caption
+        fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
 
 # Plot course lat/lon with normalized energy
-with plt.style.context('dark_background'):
-
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
-
-    # Subplot 1
-    double_up_gdf[double_up_gdf.energy_norm >= 0.5].plot(
-        ax=ax1, markersize=4, color='g', label="> 50% Max Energy", zorder=3)
-    double_up_gdf[double_up_gdf.energy_norm < 0.5].plot(
-        ax=ax1, markersize=4, color='purple', label="< 50% Max Energy", zorder=2)
-
-    ax1.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    ax1.set_xlabel("Longitude")
-    ax1.set_ylabel("Latitude")
-    ax1.set_title("Mansfield Double Up Course, 2017\nEnergy", size=20)
-    ax1.grid(True, zorder=1)
-    ax1.xaxis.label.set_size(20)
-    ax1.yaxis.label.set_size(20)
-    ax1.title.set_size(24)
-    ax1.tick_params(labelsize=16)
-
-    # Subplot 2
-    double_up_gdf[double_up_gdf.energy_norm >= 0.75].plot(
-        ax=ax2, markersize=4, color='#1a9641', label="> 75% Max Energy", zorder=5)
-    double_up_gdf[(double_up_gdf.energy_norm < 0.75) & (double_up_gdf.energy_norm >= 0.5)].plot(
-        ax=ax2, markersize=4, color='#a6d96a', label="50%-75% Max Energy", zorder=5)
-    double_up_gdf[(double_up_gdf.energy_norm < 0.5) & (double_up_gdf.energy_norm >= 0.25)].plot(
-        ax=ax2, markersize=4, color='#fdae61', label="25%-50% Max Energy", zorder=3)
-    double_up_gdf[double_up_gdf.energy_norm <= 0.25].plot(
-        ax=ax2, markersize=4, color='#d7191c', label="< 25% Max Energy", zorder=2)
-
-    ax2.legend(borderpad=0.75,
-               edgecolor='white',
-               fontsize=16,
-               shadow=True)
-
-    ax2.set_xlabel("Longitude")
-    ax2.set_ylabel("Latitude")
-    ax2.grid(True, zorder=1)
-    ax2.xaxis.label.set_size(20)
-    ax2.yaxis.label.set_size(20)
-    ax2.title.set_size(24)
-    ax2.tick_params(labelsize=16)
-
-    # Add caption
-    fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
-
-try:
-    plt.savefig(
-        fname=os.path.join("04-graphics-outputs", "double-up-gpx-data-figure-09.png"), facecolor='k', dpi=300, bbox_inches="tight")
-except Exception as error:
-    print(f"Could not save plot as PNG. ERROR: {error}")
-else:
-    print(
-        f"Saved plot as PNG: {os.path.join('04-graphics-outputs', 'double-up-gpx-data-figure-09.png')}")
+def plot_figure_09(fig_path):
+    with plt.style.context(figure_style["style"]):
+
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 20))
+
+        # Subplot 1
+        plot_course_points(
+            ax1, double_up_df_enhance[double_up_df_enhance.energy_norm >= 0.5],
+            markersize=4, color='g', label="> 50% Max Energy", zorder=3)
+        plot_course_points(
+            ax1, double_up_df_enhance[double_up_df_enhance.energy_norm < 0.5],
+            markersize=4, color='purple', label="< 50% Max Energy", zorder=2)
+
+        ax1.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        ax1.set_xlabel("Longitude")
+        ax1.set_ylabel("Latitude")
+        ax1.set_title("Mansfield Double Up Course, 2017\nEnergy", size=20)
+        ax1.grid(True, zorder=1)
+        ax1.xaxis.label.set_size(20)
+        ax1.yaxis.label.set_size(20)
+        ax1.title.set_size(24)
+        ax1.tick_params(labelsize=16)
+
+        # Subplot 2
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.energy_norm >= 0.75],
+            markersize=4, color='#1a9641', label="> 75% Max Energy", zorder=5)
+        plot_course_points(
+            ax2, double_up_df_enhance[(double_up_df_enhance.energy_norm < 0.75) & (double_up_df_enhance.energy_norm >= 0.5)],
+            markersize=4, color='#a6d96a', label="50%-75% Max Energy", zorder=5)
+        plot_course_points(
+            ax2, double_up_df_enhance[(double_up_df_enhance.energy_norm < 0.5) & (double_up_df_enhance.energy_norm >= 0.25)],
+            markersize=4, color='#fdae61', label="25%-50% Max Energy", zorder=3)
+        plot_course_points(
+            ax2, double_up_df_enhance[double_up_df_enhance.energy_norm <= 0.25],
+            markersize=4, color='#d7191c', label="< 25% Max Energy", zorder=2)
+
+        ax2.legend(borderpad=0.75,
+                   edgecolor='white',
+                   fontsize=16,
+                   shadow=True)
+
+        ax2.set_xlabel("Longitude")
+        ax2.set_ylabel("Latitude")
+        ax2.grid(True, zorder=1)
+        ax2.xaxis.label.set_size(20)
+        ax2.yaxis.label.set_size(20)
+        ax2.title.set_size(24)
+        ax2.tick_params(labelsize=16)
+
+        # Add caption
+        fig.text(0.5, .05, "Data source: Native Endurance", ha='center', fontsize=14)
+
+    try:
+        plt.savefig(
+            fname=fig_path, facecolor=figure_style["facecolor"],
+            dpi=figure_style["dpi"], bbox_inches="tight")
+    except Exception as error:
+        print(f"Could not save plot as PNG. ERROR: {error}")
+    else:
+        print(f"Saved plot as PNG: {fig_path}")
+
+
+""" Render figures """
+# Define plotting functions (figure, then helpers) and input columns
+#  for each figure
+figure_inputs = [
+    ([plot_figure_01],
+     ["time", "cadence", "distance_mile", "energy_norm", "speed_mph",
+      "vertical_speed_ft_per_sec", "elevation_ft"]),
+    ([plot_figure_02, split_vertical_movement],
+     ["time", "cadence", "vertical_speed_ft_per_sec"]),
+    ([plot_figure_03, split_vertical_movement],
+     ["time", "distance_mile", "vertical_speed_ft_per_sec"]),
+    ([plot_figure_04, split_vertical_movement],
+     ["time", "energy_norm", "vertical_speed_ft_per_sec"]),
+    ([plot_figure_05, split_vertical_movement],
+     ["time", "speed_mph", "vertical_speed_ft_per_sec"]),
+    ([plot_figure_06, plot_course_points],
+     ["latitude", "longitude", "vertical_speed_ft_per_sec"]),
+    ([plot_figure_07, plot_course_points],
+     ["latitude", "longitude", "cadence"]),
+    ([plot_figure_08, plot_course_points],
+     ["latitude", "longitude", "speed_mph"]),
+    ([plot_figure_09, plot_course_points],
+     ["latitude", "longitude", "energy_norm"])
+]
+
+# Define figure cache directory
+figure_cache_dir = os.path.join("04-graphics-outputs", ".figure-cache")
+
+# Render figures, reusing cached PNGs when inputs are unchanged
+for figure_number, (plot_functions, columns) in enumerate(
+        figure_inputs, start=1):
+
+    fig_path = os.path.join(
+        "04-graphics-outputs",
+        f"double-up-gpx-data-figure-{figure_number:02d}.png")
+
+    fingerprint = mfx.figure_fingerprint(
+        double_up_df_enhance, columns, figure_style, plot_functions)
+
+    mfx.render_cached_figure(
+        plot_functions[0], fig_path, fingerprint, figure_cache_dir)